@@ -530,7 +530,7 @@ class StreetProfile:
 
             self.heights = right[heights]
 
-        sindex = right.sindex
+        sindex = self.right.sindex
 
         results_list = []
         deviations_list = []
@@ -538,13 +538,11 @@ class StreetProfile:
         heights_deviations_list = []
         openness_list = []
 
-        for idx, row in tqdm(left.iterrows(), total=left.shape[0]):
+        for shapely_line in tqdm(left.geometry, total=left.shape[0]):
             # list to hold all the point coords
             list_points = []
             # set the current distance to place the point
             current_dist = distance
-            # make shapely MultiLineString object
-            shapely_line = row.geometry
             # get the total length of the line
             line_length = shapely_line.length
             # append the starting coordinate to the list
@@ -647,11 +645,8 @@ class StreetProfile:
                                     true_int[0].distance(Point(tick.coords[-1]))
                                 )
                         if heights is not None:
-                            indices = {}
-                            for idx, row in get_height.iterrows():
-                                dist = row.geometry.distance(Point(tick.coords[-1]))
-                                indices[idx] = dist
-                            minim = min(indices, key=indices.get)
+                            dists = get_height.geometry.distance(Point(tick.coords[-1]))
+                            minim = dists.idxmin()
                             m_heights.append(right.loc[minim][heights])
 
             openness = (len(lefts) + len(rights)) / len(ticks * 2)
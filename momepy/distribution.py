@@ -149,8 +149,8 @@ class SharedWallsRatio:
     def __init__(self, gdf, unique_id, perimeters=None):
         self.gdf = gdf
 
-        gdf = gdf.copy()
         self.sindex = gdf.sindex  # define rtree index
+        gdf = gdf.copy()
         # define empty list for results
         results_list = []
 
@@ -607,23 +607,22 @@ class MeanInterbuildingDistance:
         print("Generating adjacency matrix based on weights matrix...")
         # define adjacency list from lipysal
         adj_list = spatial_weights.to_adjlist()
-        adj_list["distance"] = -1
+        pairs = list(zip(adj_list.focal, adj_list.neighbor))
+        positions = {pair: i for i, pair in enumerate(pairs)}
+        distances = np.empty(len(pairs), dtype=np.float64)
 
         print("Computing interbuilding distances...")
         # measure each interbuilding distance of neighbours and save them to adjacency list
-        for row in tqdm(adj_list.itertuples(), total=adj_list.shape[0]):
-            inverted = adj_list[(adj_list.focal == row.neighbor)][
-                (adj_list.neighbor == row.focal)
-            ].iloc[0]["distance"]
-            if inverted == -1:
-                building_object = data.loc[row.focal]
-
-                building_neighbour = data.loc[row.neighbor]
-                adj_list.loc[row.Index, "distance"] = building_neighbour.distance(
-                    building_object
-                )
+        for i, (focal, neighbor) in tqdm(enumerate(pairs), total=len(pairs)):
+            inverted = positions[(neighbor, focal)]
+            if inverted >= i:
+                building_object = data.loc[focal]
+
+                building_neighbour = data.loc[neighbor]
+                distances[i] = building_neighbour.distance(building_object)
             else:
-                adj_list.at[row.Index, "distance"] = inverted
+                distances[i] = distances[inverted]
+        adj_list["distance"] = distances
 
         print("Computing mean interbuilding distances...")
         # iterate over objects to get the final values
@@ -713,7 +712,7 @@ class NeighboringStreetOrientationDeviation:
         gdf["tmporient"] = self.orientation
 
         print(" Generating spatial index...")
-        self.sindex = gdf.sindex
+        self.sindex = self.gdf.sindex
         results_list = []
 
         for row in tqdm(gdf.itertuples(), total=gdf.shape[0]):
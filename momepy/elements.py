@@ -217,11 +217,10 @@ class Tessellation:
         changes = {}
         qid = 0
 
-        for ix, row in tqdm(tessellation.iterrows(), total=tessellation.shape[0]):
+        for cell in tqdm(tessellation.geometry, total=tessellation.shape[0]):
             corners = []
             change = []
 
-            cell = row.geometry
             coords = cell.exterior.coords
             for i in coords:
                 point = Point(i)
@@ -252,8 +251,9 @@ class Tessellation:
                     changes[(points[1].x, points[1].y)] = new
                     qid = qid + 1
 
-        for ix, row in tqdm(tessellation.iterrows(), total=tessellation.shape[0]):
-            cell = row.geometry
+        for ix, cell in tqdm(
+            tessellation.geometry.items(), total=tessellation.shape[0]
+        ):
             coords = list(cell.exterior.coords)
 
             moves = {}
@@ -335,11 +335,14 @@ class Tessellation:
         """
         points = []
         ids = []
-        for idx, row in tqdm(objects.iterrows(), total=objects.shape[0]):
-            if row["geometry"].type in ["Polygon", "MultiPolygon"]:
-                poly_ext = row["geometry"].boundary
+        for uid, geom in tqdm(
+            objects[[unique_id, "geometry"]].itertuples(index=False, name=None),
+            total=objects.shape[0],
+        ):
+            if geom.type in ["Polygon", "MultiPolygon"]:
+                poly_ext = geom.boundary
             else:
-                poly_ext = row["geometry"]
+                poly_ext = geom
             if poly_ext is not None:
                 if poly_ext.type == "MultiLineString":
                     for line in poly_ext:
@@ -347,13 +350,13 @@ class Tessellation:
                         row_array = np.array(point_coords[:-1]).tolist()
                         for i, a in enumerate(row_array):
                             points.append(row_array[i])
-                            ids.append(row[unique_id])
+                            ids.append(uid)
                 elif poly_ext.type == "LineString":
                     point_coords = poly_ext.coords
                     row_array = np.array(point_coords[:-1]).tolist()
                     for i, a in enumerate(row_array):
                         points.append(row_array[i])
-                        ids.append(row[unique_id])
+                        ids.append(uid)
                 else:
                     raise Exception("Boundary type is {}".format(poly_ext.type))
         return points, ids
@@ -647,17 +650,18 @@ class Blocks:
 
         # if polygon is within another one, delete it
         sindex = blocks.sindex
+        geoms = blocks.geometry.values
+        delete = []
         for idx, geom in tqdm(blocks.geometry.iteritems(), total=blocks.shape[0]):
             possible_matches = list(sindex.intersection(geom.bounds))
             possible_matches.remove(idx)
-            possible = blocks.iloc[possible_matches]
 
-            for geom2 in possible.geometry:
+            for geom2 in geoms[possible_matches]:
                 if geom.within(geom2):
-                    blocks.loc[idx, "delete"] = 1
+                    delete.append(idx)
+                    break
 
-        if "delete" in blocks.columns:
-            blocks = blocks.drop(list(blocks.loc[blocks["delete"] == 1].index))
+        blocks = blocks.drop(delete)
 
         self.blocks = blocks[[id_name, "geometry"]]
 
@@ -683,7 +687,8 @@ def get_network_id(left, right, network_id, min_size=100):
     """
     Snap each element (preferably building) to the closest street network segment, saves its id.
 
-    Adds network ID to elements.
+    Adds network ID to elements. Spatial index of ``right`` is cached on the
+    GeoDataFrame, hence repeated snapping to the same network builds it only once.
 
     Parameters
     ----------
@@ -713,42 +718,35 @@ def get_network_id(left, right, network_id, min_size=100):
     >>> buildings_df['nID'][0]
     1
     """
-    INFTY = 1000000000000
     MIN_SIZE = min_size
     # MIN_SIZE should be a vaule such that if you build a box centered in each
     # point with edges of size 2*MIN_SIZE, you know a priori that at least one
     # segment is intersected with the box. Otherwise, you could get an inexact
     # solution, there is an exception checking this, though.
-    left = left.copy()
-    right = right.copy()
-
-    if not isinstance(network_id, str):
-        right["mm_nid"] = network_id
-        network_id = "mm_nid"
+    if isinstance(network_id, str):
+        network_id = right[network_id]
+    else:
+        network_id = pd.Series(network_id, index=right.index)
+    network_id = network_id.to_numpy()
 
     print("Generating centroids...")
-    buildings_c = left.copy()
-
-    buildings_c["geometry"] = buildings_c.centroid  # make centroids
+    centroids = left.centroid
 
     print("Generating rtree...")
     idx = right.sindex
+    geoms = right.geometry.values
 
     result = []
-    for p in tqdm(buildings_c.geometry, total=buildings_c.shape[0], desc="Snapping"):
+    for p in tqdm(centroids, total=centroids.shape[0], desc="Snapping"):
         pbox = (p.x - MIN_SIZE, p.y - MIN_SIZE, p.x + MIN_SIZE, p.y + MIN_SIZE)
-        hits = list(idx.intersection(pbox))
-        d = INFTY
-        nid = None
-        for h in hits:
-            new_d = p.distance(right.geometry.iloc[h])
-            if d >= new_d:
-                d = new_d
-                nid = right[network_id].iloc[h]
-        if nid is None:
+        hits = np.fromiter(idx.intersection(pbox), dtype=np.int64)
+        if hits.size == 0:
             result.append(np.nan)
         else:
-            result.append(nid)
+            dists = np.array([p.distance(geom) for geom in geoms[hits]])
+            # the last of equally close segments wins
+            nearest = hits.size - 1 - np.argmin(dists[::-1])
+            result.append(network_id[hits[nearest]])
 
     series = pd.Series(result)
 
@@ -793,22 +791,27 @@ def get_node_id(objects, nodes, edges, node_id, edge_id):
         nodes["mm_noid"] = node_id
         node_id = "mm_noid"
 
+    # first match of each id, as with a boolean lookup
+    edges_ix = (
+        edges[[edge_id, "node_start", "node_end"]]
+        .drop_duplicates(subset=edge_id)
+        .set_index(edge_id)
+    )
+    nodes_geom = nodes.drop_duplicates(subset=node_id).set_index(node_id).geometry
+
+    centroids = objects.centroid
+
     results_list = []
-    for row in tqdm(
-        objects[[edge_id, objects._geometry_column_name]].itertuples(),
-        total=objects.shape[0],
-    ):
-        if np.isnan(row[1]):
+    for eid, centroid in tqdm(zip(objects[edge_id], centroids), total=objects.shape[0]):
+        if np.isnan(eid):
 
             results_list.append(np.nan)
         else:
-            centroid = row[2].centroid
-            edge = edges.loc[edges[edge_id] == row[1]].iloc[0]
-            startID = edge.node_start
-            start = nodes.loc[nodes[node_id] == startID].iloc[0].geometry
+            startID = edges_ix.at[eid, "node_start"]
+            start = nodes_geom.at[startID]
             sd = centroid.distance(start)
-            endID = edge.node_end
-            end = nodes.loc[nodes[node_id] == endID].iloc[0].geometry
+            endID = edges_ix.at[eid, "node_end"]
+            end = nodes_geom.at[endID]
             ed = centroid.distance(end)
             if sd > ed:
                 results_list.append(endID)
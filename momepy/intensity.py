@@ -86,9 +86,6 @@ class AreaRatio:
         self.left = left
         self.right = right
 
-        left = left.copy()
-        right = right.copy()
-
         if unique_id:
             left_unique_id = unique_id
             right_unique_id = unique_id
@@ -101,26 +98,24 @@ class AreaRatio:
         self.left_unique_id = left_unique_id
         self.right_unique_id = right_unique_id
 
-        if not isinstance(left_areas, str):
-            left["mm_a"] = left_areas
-            left_areas = "mm_a"
-        self.left_areas = left[left_areas]
-        if not isinstance(right_areas, str):
-            right["mm_a"] = right_areas
-            right_areas = "mm_a"
-        self.right_areas = right[right_areas]
+        if isinstance(left_areas, str):
+            left_areas = left[left_areas]
+        else:
+            left_areas = pd.Series(left_areas, index=left.index)
+        self.left_areas = left_areas
+        if isinstance(right_areas, str):
+            right_areas = right[right_areas]
+        else:
+            right_areas = pd.Series(right_areas, index=right.index)
+        self.right_areas = right_areas
 
-        look_for = right[
-            [right_unique_id, right_areas]
-        ].copy()  # keeping only necessary columns
-        look_for.rename(index=str, columns={right_areas: "lf_area"}, inplace=True)
-        look_for = look_for.groupby(right_unique_id).sum().reset_index()
-        objects_merged = left[[left_unique_id, left_areas]].merge(
-            look_for, left_on=left_unique_id, right_on=right_unique_id, how="left"
-        )
-        objects_merged.index = left.index
+        lf_area = right_areas.groupby(right[right_unique_id]).sum()
 
-        self.series = objects_merged["lf_area"] / objects_merged[left_areas]
+        num = left[left_unique_id].map(lf_area).to_numpy(dtype=np.float64)
+        den = left_areas.to_numpy(dtype=np.float64)
+        ratio = np.divide(num, den, out=np.full_like(num, np.nan), where=den != 0)
+
+        self.series = pd.Series(ratio, index=left.index)
 
 
 class Count:
@@ -178,20 +173,18 @@ class Count:
         self.right_id = right[right_id]
         self.weighted = weighted
 
-        count = collections.Counter(right[right_id])
-        df = pd.DataFrame.from_dict(count, orient="index", columns=["mm_count"])
-        joined = left[[left_id, "geometry"]].join(df["mm_count"], on=left_id)
-        joined.loc[joined["mm_count"].isna(), "mm_count"] = 0
+        counts = right.groupby(right_id).size()
+        count = left[left_id].map(counts).fillna(0).to_numpy(dtype=np.int64)
 
         if weighted:
             if left.geometry[0].type in ["Polygon", "MultiPolygon"]:
-                joined["mm_count"] = joined["mm_count"] / left.geometry.area
+                count = count / left.geometry.area.to_numpy()
             elif left.geometry[0].type in ["LineString", "MultiLineString"]:
-                joined["mm_count"] = joined["mm_count"] / left.geometry.length
+                count = count / left.geometry.length.to_numpy()
             else:
                 raise TypeError("Geometry type does not support weighting.")
 
-        self.series = joined["mm_count"]
+        self.series = pd.Series(count, index=left.index, name="mm_count")
 
 
 class Courtyards:
@@ -210,6 +203,8 @@ class Courtyards:
     spatial_weights : libpysal.weights, optional
         spatial weights matrix - If None, Queen contiguity matrix will be calculated
         based on objects. It is to denote adjacent buildings (note: based on integer index).
+    verbose : bool (default False)
+        if ``True``, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -225,23 +220,20 @@ class Courtyards:
     Examples
     --------
     >>> buildings_df['courtyards'] = mm.Courtyards(buildings_df, 'bID').series
-    Calculating spatial weights...
     """
 
-    def __init__(self, gdf, block_id, spatial_weights=None):
+    def __init__(self, gdf, block_id, spatial_weights=None, verbose=False):
         self.gdf = gdf
 
-        results_list = []
-        gdf = gdf.copy()
-
-        if not isinstance(block_id, str):
-            gdf["mm_bid"] = block_id
-            block_id = "mm_bid"
-
-        self.block_id = gdf[block_id]
+        if isinstance(block_id, str):
+            block_id = gdf[block_id]
+        else:
+            block_id = pd.Series(block_id, index=gdf.index)
+        self.block_id = block_id
         # if weights matrix is not passed, generate it from objects
         if spatial_weights is None:
-            print("Calculating spatial weights...")
+            if verbose:
+                print("Calculating spatial weights...")
             from libpysal.weights import Queen
 
             spatial_weights = Queen.from_dataframe(gdf, silence_warnings=True)
@@ -250,7 +242,7 @@ class Courtyards:
         # dict to store nr of courtyards for each uID
         courtyards = {}
         components = pd.Series(spatial_weights.component_labels, index=gdf.index)
-        for index in tqdm(gdf.index, total=gdf.shape[0]):
+        for index in tqdm(gdf.index, total=gdf.shape[0], disable=not verbose):
             # if the id is already present in courtyards, continue (avoid repetition)
             if index in courtyards:
                 continue
@@ -267,11 +259,8 @@ class Courtyards:
                     print("Something unexpected happened.")
                 for b in to_join:
                     courtyards[b] = interiors  # fill dict with values
-        # copy values from dict to gdf
-        for index, row in tqdm(gdf.iterrows(), total=gdf.shape[0]):
-            results_list.append(courtyards[index])
 
-        self.series = pd.Series(results_list, index=gdf.index)
+        self.series = pd.Series(courtyards).reindex(gdf.index)
 
 
 class BlocksCount:
@@ -296,6 +285,8 @@ class BlocksCount:
         name of the column with unique id used as ``spatial_weights`` index
     weigted : bool, default True
         return value weighted by the analysed area (``True``) or pure count (``False``)
+    verbose : bool (default False)
+        if ``True``, shows progress bar
 
     Attributes
     ----------
@@ -318,7 +309,9 @@ class BlocksCount:
     >>> tessellation_df['blocks_within_4'] = mm.BlocksCount(tessellation_df, 'bID', sw4, 'uID').series
     """
 
-    def __init__(self, gdf, block_id, spatial_weights, unique_id, weighted=True):
+    def __init__(
+        self, gdf, block_id, spatial_weights, unique_id, weighted=True, verbose=False
+    ):
 
         self.gdf = gdf
         self.sw = spatial_weights
@@ -327,30 +320,32 @@ class BlocksCount:
 
         # define empty list for results
         results_list = []
-        data = gdf.copy()
-        if not isinstance(block_id, str):
-            data["mm_bid"] = block_id
-            block_id = "mm_bid"
-        self.block_id = data[block_id]
-        data = data.set_index(unique_id)
+        if isinstance(block_id, str):
+            block_id = gdf[block_id]
+        else:
+            block_id = pd.Series(block_id, index=gdf.index)
+        self.block_id = block_id
+        ids = pd.Index(gdf[unique_id])
+        codes, _ = pd.factorize(block_id)
 
         if weighted is True:
-            areas = data.geometry.area
+            areas = gdf.geometry.area.to_numpy()
 
-        for index in tqdm(data.index, total=data.shape[0]):
+        for index in tqdm(ids, total=ids.shape[0], disable=not verbose):
             if index in spatial_weights.neighbors.keys():
                 neighbours = spatial_weights.neighbors[index].copy()
                 neighbours.append(index)
+                positions = ids.get_indexer(neighbours)
+                if (positions == -1).any():
+                    missing = [n for n, p in zip(neighbours, positions) if p == -1]
+                    raise KeyError("{} not in {}".format(missing, unique_id))
 
-                vicinity = data.loc[neighbours]
+                blocks_nr = np.unique(codes[positions]).shape[0]
 
                 if weighted is True:
-                    results_list.append(
-                        vicinity[block_id].unique().shape[0]
-                        / sum(areas.loc[neighbours])
-                    )
+                    results_list.append(blocks_nr / areas[positions].sum())
                 elif weighted is False:
-                    results_list.append(vicinity[block_id].unique().shape[0])
+                    results_list.append(blocks_nr)
                 else:
                     raise ValueError("Attribute 'weighted' needs to be True or False.")
             else:
@@ -393,6 +388,8 @@ class Reached:
         of reached elements.
     values : str (default None)
         the name of the objects dataframe column with values used for calculations
+    verbose : bool (default False)
+        if ``True``, shows progress bar
 
     Attributes
     ----------
@@ -428,6 +425,7 @@ class Reached:
         spatial_weights=None,
         mode="count",
         values=None,
+        verbose=False,
     ):
         self.left = left
         self.right = right
@@ -451,7 +449,9 @@ class Reached:
             count = collections.Counter(right[right_id])
 
         # iterating over rows one by one
-        for index, lid in tqdm(left[left_id].iteritems(), total=left.shape[0]):
+        for index, lid in tqdm(
+            left[left_id].iteritems(), total=left.shape[0], disable=not verbose
+        ):
             if spatial_weights is None:
                 ids = [lid]
             else:
@@ -519,6 +519,8 @@ class NodeDensity:
         name of the column of right gdf containing id of starting node
     node_end : str (default 'node_end')
         name of the column of right gdf containing id of ending node
+    verbose : bool (default False)
+        if ``True``, shows progress bar
 
     Attributes
     ----------
@@ -554,6 +556,7 @@ class NodeDensity:
         node_degree=None,
         node_start="node_start",
         node_end="node_end",
+        verbose=False,
     ):
         self.left = left
         self.right = right
@@ -569,7 +572,7 @@ class NodeDensity:
         lengths = right.geometry.length
 
         # iterating over rows one by one
-        for index in tqdm(left.index, total=left.shape[0]):
+        for index in tqdm(left.index, total=left.shape[0], disable=not verbose):
 
             neighbours = list(spatial_weights.neighbors[index])
             neighbours.append(index)
@@ -614,6 +617,8 @@ class Density:
     areas :  str, list, np.array, pd.Series (optional)
         the name of the dataframe column, ``np.array``, or ``pd.Series`` where is stored area value. If None,
         gdf.geometry.area will be used.
+    verbose : bool (default False)
+        if ``True``, shows progress bar
 
     Attributes
     ----------
@@ -635,7 +640,9 @@ class Density:
     >>> tessellation_df['floor_area_dens'] = mm.Density(tessellation_df, 'floor_area', sw, 'uID').series
     """
 
-    def __init__(self, gdf, values, spatial_weights, unique_id, areas=None):
+    def __init__(
+        self, gdf, values, spatial_weights, unique_id, areas=None, verbose=False
+    ):
         self.gdf = gdf
         self.sw = spatial_weights
         self.id = gdf[unique_id]
@@ -660,7 +667,7 @@ class Density:
 
         data = data.set_index(unique_id)
         # iterating over rows one by one
-        for index in tqdm(data.index, total=data.shape[0]):
+        for index in tqdm(data.index, total=data.shape[0], disable=not verbose):
             if index in spatial_weights.neighbors.keys():
                 neighbours = spatial_weights.neighbors[index].copy()
                 if neighbours:
@@ -3,6 +3,7 @@
 
 import libpysal
 import numpy as np
+from scipy.spatial import cKDTree
 
 
 __all__ = ["DistanceBand", "sw_high"]
@@ -15,9 +16,10 @@ class DistanceBand:
     Mimic the behavior of ``libpysal.weights.DistanceBand`` but do not compute all
     neighbors at once but only on demand. Only ``DistanceBand.neighbors[key]`` is
     implemented. Once user asks for ``DistanceBand.neighbors[key]``, neighbors for
-    specified key will be computed using rtree. The algorithm is significantly
-    slower than ``libpysal.weights.DistanceBand`` but allows for large number of
-    neighbors which may cause memory issues in libpysal.
+    specified key will be computed using KD-tree of centroids (or rtree if
+    ``centroid=False``). The algorithm is significantly slower than
+    ``libpysal.weights.DistanceBand`` but allows for large number of neighbors
+    which may cause memory issues in libpysal.
 
     Use ``libpysal.weights.DistanceBand`` if possible. ``momepy.weights.DistanceBand``
     only when necessary. ``DistanceBand.neighbors[key]`` should yield same results as
@@ -43,19 +45,26 @@ class DistanceBand:
     """
 
     def __init__(self, gdf, threshold, centroid=True, ids=None):
-        if centroid:
-            gdf.geometry = gdf.centroid
-
-        self.neighbors = _Neighbors(gdf, threshold, ids=ids)
+        self.neighbors = _Neighbors(gdf, threshold, ids=ids, centroid=centroid)
 
     def fetch_items(self, key):
-        possible_matches_index = list(
-            self.sindex.intersection(self.bufferred[key].bounds)
+        if self.tree is not None:
+            match = self.tree.query_ball_point(self.coords[key], self.buffer)
+            match.remove(key)
+            return match
+
+        geom = self.geoms.geometry.iloc[key]
+        minx, miny, maxx, maxy = geom.bounds
+        bbox = (
+            minx - self.buffer,
+            miny - self.buffer,
+            maxx + self.buffer,
+            maxy + self.buffer,
         )
-        possible_matches = self.geoms.iloc[possible_matches_index]
-        match = possible_matches.index[
-            possible_matches.intersects(self.bufferred[key])
-        ].to_list()
+        possible_matches_index = list(self.sindex.intersection(bbox))
+        possible_matches = self.geoms.geometry.iloc[possible_matches_index]
+        mask = (possible_matches.distance(geom) <= self.buffer).to_numpy()
+        match = np.asarray(possible_matches_index)[mask].tolist()
         match.remove(key)
         return match
 
@@ -65,10 +74,16 @@ class _Neighbors(dict, DistanceBand):
     Helper class for DistanceBand.
     """
 
-    def __init__(self, geoms, buffer, ids):
+    def __init__(self, geoms, buffer, ids, centroid=False):
         self.geoms = geoms
-        self.sindex = geoms.sindex
-        self.bufferred = geoms.buffer(buffer)
+        self.buffer = buffer
+        if centroid:
+            centroids = geoms.centroid
+            self.coords = np.column_stack((centroids.x, centroids.y))
+            self.tree = cKDTree(self.coords)
+        else:
+            self.tree = None
+            self.sindex = geoms.sindex
         if ids:
             self.ids = np.array(geoms[ids])
         else:
@@ -2,7 +2,7 @@ import geopandas as gpd
 import momepy as mm
 import numpy as np
 import pytest
-from libpysal.weights import Queen
+from libpysal.weights import Queen, W
 
 
 class TestDistribution:
@@ -148,6 +148,13 @@ class TestDistribution:
             .series.isna()
             .any()
         )
+        neighbors = {k: [n for n in v if n != 1] for k, v in sw.neighbors.items()}
+        neighbors[1] = []
+        sw_island = W(neighbors, silence_warnings=True)
+        island = mm.MeanInterbuildingDistance(
+            self.df_buildings, sw_island, "uID", order=3
+        ).series
+        assert island[0] == 0
 
     def test_NeighboringStreetOrientationDeviation(self):
         self.df_streets["dev"] = mm.NeighboringStreetOrientationDeviation(
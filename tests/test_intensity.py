@@ -77,6 +77,12 @@ class TestIntensity:
         self.blocks["area"] = self.blocks.geometry.area
         car_block = mm.AreaRatio(self.blocks, self.df_buildings, "area", "area", "bID")
         assert car_block.series.mean() == 0.2761974319698012
+        zero_area = self.df_tessellation.area.copy()
+        zero_area.iloc[0] = 0
+        car_zero = mm.AreaRatio(
+            self.df_tessellation, self.df_buildings, zero_area, "area", "uID"
+        ).series
+        assert np.isnan(car_zero.iloc[0])
 
     def test_Count(self):
         eib = mm.Count(self.blocks, self.df_buildings, "bID", "bID").series
@@ -126,6 +132,8 @@ class TestIntensity:
             .series.isna()
             .any()
         )
+        with pytest.raises(KeyError):
+            mm.BlocksCount(self.df_tessellation.iloc[:-5], "bID", sw, "uID")
 
     def test_Reached(self):
         count = mm.Reached(self.df_streets, self.df_buildings, "nID", "nID").series
@@ -45,5 +45,15 @@ class TestWeights:
 
         db_cent_false = mm.DistanceBand(self.df_buildings, 100, centroid=False)
         assert sorted(db_cent_false.neighbors[0]) == sorted(
-            [125, 133, 114, 134, 113, 121]
+            [111, 112, 113, 114, 115, 120, 121, 125, 130, 133, 134]
+        )
+        assert (self.df_buildings.geom_type == "Polygon").all()
+
+        shifted = self.df_buildings.copy()
+        shifted.index += 1000
+        db_shifted = mm.DistanceBand(shifted, 100)
+        assert sorted(db_shifted.neighbors[0]) == sorted(db.neighbors[0])
+        db_shifted_false = mm.DistanceBand(shifted, 100, centroid=False)
+        assert sorted(db_shifted_false.neighbors[0]) == sorted(
+            db_cent_false.neighbors[0]
         )